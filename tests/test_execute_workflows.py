@@ -0,0 +1,89 @@
+import threading
+import time
+
+import pytest
+
+from wake_ai.core.utils import execute_workflows
+
+
+class FakeWorkflow:
+    """Stand-in for AIWorkflow that records how many executions overlap."""
+
+    def __init__(self, name, tracker, show_progress=False):
+        self.name = name
+        self._show_progress = show_progress
+        self._tracker = tracker
+
+    def execute(self, resume=False):
+        with self._tracker["lock"]:
+            self._tracker["running"] += 1
+            self._tracker["max_running"] = max(self._tracker["max_running"], self._tracker["running"])
+        time.sleep(0.05)
+        with self._tracker["lock"]:
+            self._tracker["running"] -= 1
+        if self.name == "failing":
+            raise RuntimeError("workflow failed")
+        return {"name": self.name, "resume": resume}, None
+
+
+@pytest.fixture
+def tracker():
+    return {"lock": threading.Lock(), "running": 0, "max_running": 0}
+
+
+def test_concurrency_limit(tracker):
+    workflows = [FakeWorkflow(f"wf{i}", tracker) for i in range(6)]
+
+    results = execute_workflows(workflows, resume=True, max_concurrency=2)
+
+    assert [r[0]["name"] for r in results] == [f"wf{i}" for i in range(6)]
+    assert all(r[0]["resume"] for r in results)
+    assert tracker["max_running"] == 2
+
+
+def test_exceptions_are_returned_in_place(tracker):
+    workflows = [FakeWorkflow("ok", tracker), FakeWorkflow("failing", tracker)]
+
+    results = execute_workflows(workflows, max_concurrency=2)
+
+    assert results[0][0]["name"] == "ok"
+    assert isinstance(results[1], RuntimeError)
+
+
+def test_env_concurrency(tracker, monkeypatch):
+    monkeypatch.setenv("WAKE_AI_CONCURRENCY", "1")
+    workflows = [FakeWorkflow(f"wf{i}", tracker) for i in range(3)]
+
+    execute_workflows(workflows)
+
+    assert tracker["max_running"] == 1
+
+
+def test_progress_display_rejected_when_concurrent(tracker):
+    workflows = [FakeWorkflow("a", tracker), FakeWorkflow("b", tracker, show_progress=True)]
+
+    with pytest.raises(ValueError, match="show_progress=False"):
+        execute_workflows(workflows, max_concurrency=2)
+    assert tracker["max_running"] == 0
+
+
+def test_progress_display_allowed_when_sequential(tracker):
+    workflows = [FakeWorkflow("a", tracker, show_progress=True), FakeWorkflow("b", tracker, show_progress=True)]
+
+    results = execute_workflows(workflows, max_concurrency=1)
+
+    assert [r[0]["name"] for r in results] == ["a", "b"]
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+def test_invalid_max_concurrency(tracker, max_concurrency):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        execute_workflows([FakeWorkflow("a", tracker)], max_concurrency=max_concurrency)
+
+
+@pytest.mark.parametrize("value", ["abc", "0", "-2"])
+def test_invalid_env_concurrency(tracker, monkeypatch, value):
+    monkeypatch.setenv("WAKE_AI_CONCURRENCY", value)
+
+    with pytest.raises(ValueError, match="WAKE_AI_CONCURRENCY"):
+        execute_workflows([FakeWorkflow("a", tracker)])
@@ -1,45 +1,51 @@
 """Wake AI - AI-powered smart contract security analysis framework."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Workflow modules register their commands on this group at import time
 from .cli import main as workflow
 
-# Framework imports
-from .core import (
-    ClaudeCodeResponse,
-    ClaudeCodeSession,
-    AIWorkflow,
-    WorkflowStep,
-    ClaudeNotAvailableError,
-    WorkflowExecutionError,
-)
+if TYPE_CHECKING:
+    # Framework imports
+    from .core import (
+        ClaudeCodeResponse,
+        ClaudeCodeSession,
+        AIWorkflow,
+        WorkflowStep,
+        ClaudeNotAvailableError,
+        WorkflowExecutionError,
+    )
 
-# Result imports
-from .results import (
-    AIResult,
-    SimpleResult,
-    MessageResult,
-)
+    # Result imports
+    from .results import (
+        AIResult,
+        SimpleResult,
+        MessageResult,
+    )
 
-# Detection imports
-from .detections import (
-    Detection,
-    Location,
-    Severity,
-)
-from .utils.formatters import (
-    print_detection,
-    export_detections_json,
-)
+    # Detection imports
+    from .detections import (
+        Detection,
+        Location,
+        Severity,
+    )
+    from .utils.formatters import (
+        print_detection,
+        print_detections,
+        export_detections_json,
+    )
 
-# Utils imports
-from .utils.workflow import (
-    load_workflow_from_file,
-)
+    # Utils imports
+    from .utils.workflow import (
+        load_workflow_from_file,
+    )
 
-# Template imports
-from .templates import (
-    SimpleDetector,
-    SimpleDetectorResult,
-)
+    # Template imports
+    from .templates import (
+        SimpleDetector,
+        SimpleDetectorResult,
+    )
 
 
 __version__ = "0.1.0"
@@ -61,6 +67,7 @@ __all__ = [
     "Location",
     "Severity",
     "print_detection",
+    "print_detections",
     "export_detections_json",
     # Utils
     "load_workflow_from_file",
@@ -69,4 +76,37 @@ __all__ = [
     "SimpleDetectorResult",
     # Version
     "__version__",
-]
\ No newline at end of file
+]
+
+# Module providing each lazily imported public name
+_LAZY_IMPORTS = {
+    "ClaudeCodeResponse": ".core",
+    "ClaudeCodeSession": ".core",
+    "AIWorkflow": ".core",
+    "WorkflowStep": ".core",
+    "ClaudeNotAvailableError": ".core",
+    "WorkflowExecutionError": ".core",
+    "AIResult": ".results",
+    "SimpleResult": ".results",
+    "MessageResult": ".results",
+    "Detection": ".detections",
+    "Location": ".detections",
+    "Severity": ".detections",
+    "print_detection": ".utils.formatters",
+    "print_detections": ".utils.formatters",
+    "export_detections_json": ".utils.formatters",
+    "load_workflow_from_file": ".utils.workflow",
+    "SimpleDetector": ".templates",
+    "SimpleDetectorResult": ".templates",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # Import the workflow engine (Claude SDK, Jinja2, pydantic) only when it is used
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
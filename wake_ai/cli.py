@@ -339,13 +339,13 @@ def factory_callback(workflow: Optional[AIWorkflow], model: str, resume: bool, w
         if export:
             # Export to JSON
             if hasattr(formatted_results, 'export_json'):
-                import json
+                from wake_ai.utils.common import dumps_json
                 results = {
                     "results": formatted_results.to_dict(),
                     "metadata": results["metadata"],
                 }
                 Path(export).parent.mkdir(parents=True, exist_ok=True)
-                Path(export).write_text(json.dumps(results, indent=2))
+                Path(export).write_bytes(dumps_json(results))
                 console.print(f"[green]Results exported to:[/green] {export}")
         else:
             # Pretty print to console
@@ -3,7 +3,7 @@
 from .claude import ClaudeCodeResponse, ClaudeCodeSession
 from .flow import AIWorkflow, WorkflowStep
 from .exceptions import ClaudeNotAvailableError, WorkflowExecutionError
-from .utils import validate_claude_cli
+from .utils import execute_workflows, execute_workflows_async, validate_claude_cli
 
 __all__ = [
     "ClaudeCodeResponse",
@@ -13,4 +13,6 @@ __all__ = [
     "ClaudeNotAvailableError",
     "WorkflowExecutionError",
     "validate_claude_cli",
+    "execute_workflows",
+    "execute_workflows_async",
 ]
\ No newline at end of file
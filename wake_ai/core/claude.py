@@ -132,8 +132,8 @@ class ClaudeCodeSession:
         )
         if session_id:
             logger.debug(f"Session ID provided: {session_id}")
-        logger.debug(f"Allowed tools: {self.allowed_tools}")
-        logger.debug(f"Disallowed tools: {self.disallowed_tools}")
+        logger.debug("Allowed tools: %s", self.allowed_tools)
+        logger.debug("Disallowed tools: %s", self.disallowed_tools)
 
         # Ensure Claude CLI is installed and accessible
         from .utils import validate_claude_cli
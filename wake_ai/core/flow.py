@@ -30,9 +30,9 @@ from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Type, Union
 
 import rich_click as click
 from jinja2 import Environment, StrictUndefined, Template, meta
@@ -50,12 +50,28 @@ from rich.progress import (
 from rich.table import Table
 
 from ..results import AIResult, MessageResult
+from ..utils.common import dumps_json, loads_json
 from ..utils.logging import get_logger
 from .claude import ClaudeCodeResponse, ClaudeCodeSession
 
 # Set up logging
 logger = get_logger(__name__)
 
+# Shared Jinja2 environment with strict undefined to catch missing variables
+_JINJA_ENV = Environment(undefined=StrictUndefined)
+
+
+@lru_cache(maxsize=128)
+def _compile_prompt_template(prompt_template: str) -> Tuple[Template, FrozenSet[str]]:
+    """Compile a prompt template once and collect the variables it uses.
+
+    Step retries and repeated runs of the same workflow render the same
+    template again, so the parse and compile work is reused.
+    """
+    ast = _JINJA_ENV.parse(prompt_template)
+    variables = frozenset(meta.find_undeclared_variables(ast))
+    return _JINJA_ENV.from_string(ast), variables
+
 
 def require_initialized(func):
     """Decorator to ensure __init__ was called on AIWorkflow instances."""
@@ -113,12 +129,8 @@ class WorkflowStep:
             f"Formatting prompt for step '{self.name}' with context keys: {list(context.keys())}"
         )
 
-        # Create Jinja2 environment with strict undefined to catch missing variables
-        env = Environment(undefined=StrictUndefined)
-
-        # Parse the template to find all variables
-        ast = env.parse(self.prompt_template)
-        prompt_context_keys = meta.find_undeclared_variables(ast)
+        # Parse the template to find all variables (compiled once per template)
+        template, prompt_context_keys = _compile_prompt_template(self.prompt_template)
 
         # Warn if there are context keys that are not in the context
         for key in prompt_context_keys:
@@ -128,7 +140,6 @@ class WorkflowStep:
                 )
 
         # Render the template
-        template = env.from_string(self.prompt_template)
         return template.render(**context)
 
     def validate_response(self, response: ClaudeCodeResponse) -> Tuple[bool, List[str]]:
@@ -138,12 +149,12 @@ class WorkflowStep:
             Tuple of (success: bool, errors: List[str])
         """
         if not response.success:
-            logger.debug(f"Step '{self.name}' Claude query failed: {response.content}")
+            logger.debug("Step '%s' Claude query failed: %s", self.name, response.content)
             return (False, [response.content or "Claude query failed"])
 
         if self.validator:
             result = self.validator(response)
-            logger.debug(f"Step '{self.name}' custom validator returned: {result}")
+            logger.debug("Step '%s' custom validator returned: %s", self.name, result)
             return result
 
         # Default validation - just check if content exists
@@ -684,12 +695,9 @@ class AIWorkflow(ABC):
                                 )
                         else:
                             # Retry attempt - add error correction prompt
-                            error_prompt = (
-                                "The following errors occurred, please fix them:\n"
+                            prompt = "The following errors occurred, please fix them:\n" + "".join(
+                                f"- {error}\n" for error in validation_errors
                             )
-                            for error in validation_errors:
-                                error_prompt += f"- {error}\n"
-                            prompt = error_prompt
                             logger.info(
                                 f"Retrying step '{step.name}' (attempt {retry_count}/{step.max_retries}) - previous attempt failed validation"
                             )
@@ -758,7 +766,7 @@ class AIWorkflow(ABC):
                             logger.info(
                                 f"Step '{step.name}' completed{retry_msg} - cost: ${step_total_cost:.4f}, turns: {step_total_turns}"
                             )
-                            logger.debug(f"Response: {response.content}")
+                            logger.debug("Response: %s", response.content)
 
                             # Calculate step duration
                             step_duration = (
@@ -1190,14 +1198,14 @@ class AIWorkflow(ABC):
             "progress_percentage": self.state.progress_percentage,
         }
         state_file = self.working_dir / f"{self.name}_state.json"
-        state_file.write_text(json.dumps(state_data, indent=2))
+        state_file.write_bytes(dumps_json(state_data))
         logger.debug(f"Saved workflow state to {state_file}")
 
     def _load_state(self):
         """Load workflow state."""
         state_file = self.working_dir / f"{self.name}_state.json"
         logger.debug(f"Loading workflow state from {state_file}")
-        data = json.loads(state_file.read_text())
+        data = loads_json(state_file.read_bytes())
         self.state.current_step = data["current_step"]
         self.state.completed_steps = data["completed_steps"]
         self.state.skipped_steps = data["skipped_steps"]
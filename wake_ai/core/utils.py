@@ -1,8 +1,16 @@
 """Framework utility functions."""
 
+import asyncio
+import os
 import subprocess
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+
 from .exceptions import ClaudeNotAvailableError
 
+if TYPE_CHECKING:
+    from ..results import AIResult
+    from .flow import AIWorkflow
+
 
 def validate_claude_cli():
     """Check if Claude Code CLI is available and properly configured.
@@ -22,4 +30,82 @@ def validate_claude_cli():
             raise ClaudeNotAvailableError()
 
     except FileNotFoundError:
-        raise ClaudeNotAvailableError()
\ No newline at end of file
+        raise ClaudeNotAvailableError()
+
+
+def _default_concurrency() -> int:
+    """Number of workflows executed at once, configurable via WAKE_AI_CONCURRENCY."""
+    value = os.environ.get("WAKE_AI_CONCURRENCY", "4")
+    try:
+        concurrency = int(value)
+    except ValueError:
+        raise ValueError(f"WAKE_AI_CONCURRENCY must be a positive integer, got {value!r}") from None
+    if concurrency < 1:
+        raise ValueError(f"WAKE_AI_CONCURRENCY must be a positive integer, got {value!r}")
+    return concurrency
+
+
+async def execute_workflows_async(
+    workflows: Sequence["AIWorkflow"],
+    resume: bool = False,
+    max_concurrency: Optional[int] = None,
+) -> List[Union[Tuple[Dict[str, Any], "AIResult"], BaseException]]:
+    """Execute independent workflows concurrently.
+
+    Each workflow runs its blocking execute() in a worker thread, so runs
+    overlap while waiting on Claude. Exceptions are returned in place of the
+    result of the workflow that raised them instead of cancelling the others.
+
+    The progress display of a workflow is a rich Live, and only one Live can
+    be active on a console at a time. Workflows that may run at the same time
+    must therefore be created with show_progress=False.
+
+    Args:
+        workflows: Workflows to execute
+        resume: Passed to each workflow's execute()
+        max_concurrency: Maximum number of workflows running at once
+                         (default: WAKE_AI_CONCURRENCY or 4)
+
+    Returns:
+        Results of execute() or the raised exception, in the order of workflows
+
+    Raises:
+        ValueError: If max_concurrency or WAKE_AI_CONCURRENCY is not a positive
+                    integer, or if workflows would run concurrently with
+                    progress display enabled
+    """
+    if max_concurrency is None:
+        concurrency = _default_concurrency()
+    elif max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be a positive integer, got {max_concurrency!r}")
+    else:
+        concurrency = max_concurrency
+
+    if concurrency > 1 and len(workflows) > 1:
+        for workflow in workflows:
+            if workflow._show_progress:
+                raise ValueError(
+                    f"Workflow '{workflow.name}' has progress display enabled; "
+                    "create workflows with show_progress=False to execute them concurrently"
+                )
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(workflow: "AIWorkflow"):
+        async with semaphore:
+            return await asyncio.to_thread(workflow.execute, resume=resume)
+
+    return await asyncio.gather(
+        *(run_one(workflow) for workflow in workflows), return_exceptions=True
+    )
+
+
+def execute_workflows(
+    workflows: Sequence["AIWorkflow"],
+    resume: bool = False,
+    max_concurrency: Optional[int] = None,
+) -> List[Union[Tuple[Dict[str, Any], "AIResult"], BaseException]]:
+    """Synchronous wrapper around execute_workflows_async."""
+    return asyncio.run(
+        execute_workflows_async(workflows, resume=resume, max_concurrency=max_concurrency)
+    )
@@ -20,7 +20,7 @@ class Severity(StrEnum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     """Location information without IR dependency."""
 
@@ -54,8 +54,23 @@ class Location:
 
         return data
 
-
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Location:
+        """Create Location from dictionary."""
+        file_path = data.get("file_path")
+        return cls(
+            target=data["target"],
+            file_path=Path(file_path) if file_path is not None else None,
+            source_unit_name=data.get("source_unit_name"),
+            start_line=data.get("start_line"),
+            end_line=data.get("end_line"),
+            start_offset=data.get("start_offset"),
+            end_offset=data.get("end_offset"),
+            source_snippet=data.get("source_snippet"),
+        )
+
+
+@dataclass(slots=True)
 class Detection:
     """Detection result combining all detection information."""
 
@@ -95,20 +110,8 @@ class Detection:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Detection:
         """Create Detection from dictionary."""
-        # Parse location if present
-        location = None
-        if "location" in data:
-            loc_data = data["location"]
-            location = Location(
-                target=loc_data["target"],
-                file_path=Path(loc_data["file_path"]) if "file_path" in loc_data else None,
-                source_unit_name=loc_data.get("source_unit_name"),
-                start_line=loc_data.get("start_line"),
-                end_line=loc_data.get("end_line"),
-                start_offset=loc_data.get("start_offset"),
-                end_offset=loc_data.get("end_offset"),
-                source_snippet=loc_data.get("source_snippet"),
-            )
+        loc_data = data.get("location")
+        location = Location.from_dict(loc_data) if loc_data is not None else None
 
         return cls(
             name=data["name"],
@@ -1,5 +1,7 @@
 """Audit workflow specific detection result parsing."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional, TYPE_CHECKING
@@ -11,8 +13,15 @@ from wake_ai.results import AIResult
 if TYPE_CHECKING:
     from rich.console import Console
 
+# Prefer the libyaml-backed loader when available (same output as safe_load)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+# Issue files are parsed in a thread pool once there are more than this many
+_PARALLEL_PARSE_THRESHOLD = 8
+_MAX_PARSE_WORKERS = 8
+
+
+@dataclass(slots=True)
 class AuditDetection:
     """Audit-specific detection with impact and confidence instead of severity."""
 
@@ -52,6 +61,8 @@ class AuditDetection:
 class AuditResult(AIResult):
     """Detection result specifically for security audit workflows."""
 
+    __slots__ = ("detections", "working_dir", "metadata")
+
     def __init__(self, detections: List[AuditDetection], working_dir: Path, metadata: Optional[Dict[str, Any]] = None):
         self.detections = detections
         self.working_dir = working_dir
@@ -80,71 +91,85 @@ class AuditResult(AIResult):
         Returns:
             List of AuditDetection objects
         """
-        results = []
-
         # Look for issues directory directly in working_dir
-        issues_dir = working_dir / "issues"
-        if not issues_dir.exists():
-            return results
-
-        # Parse each YAML issue file
-        for issue_file in issues_dir.glob("*.yaml"):
-            try:
-                # Load the YAML file
-                with open(issue_file, 'r') as f:
-                    issue_data = yaml.safe_load(f)
-
-                if not isinstance(issue_data, dict):
-                    continue
-
-                # Extract basic fields
-                name = issue_data.get('name', issue_file.stem)
-                impact = issue_data.get('impact', 'medium')
-                confidence = issue_data.get('confidence', 'medium')
-                detection_type = issue_data.get('detection_type', 'N/A')
-
-                # Parse location
-                location = None
-                if 'location' in issue_data and isinstance(issue_data['location'], dict):
-                    loc = issue_data['location']
-                    location = Location(
-                        target=loc.get('target', 'Unknown'),
-                        file_path=Path(loc['file']) if 'file' in loc else None,
-                        start_line=loc.get('start_line'),
-                        end_line=loc.get('end_line'),
-                        source_snippet=loc.get('code_snippet')
-                    )
-
-                # Get content fields (with markdown/asciidoc content)
-                description_text = issue_data.get('description', 'No description provided')
-                recommendation = issue_data.get('recommendation', '')
-                exploit = issue_data.get('exploit', '')
-
-                # Create the audit detection
-                detection = AuditDetection(
-                    name=name,
-                    impact=impact,
-                    confidence=confidence,
-                    detection_type=detection_type,
-                    source="audit",  # Automatically set to workflow name
-                    location=location,
-                    description=description_text,
-                    recommendation=recommendation,
-                    exploit=exploit
+        # (plain strings avoid building a Path per issue file)
+        issues_dir = os.path.join(working_dir, "issues")
+
+        # Parse each YAML issue file (a missing directory means no issues)
+        try:
+            with os.scandir(issues_dir) as entries:
+                issue_files = [
+                    (entry.path, entry.name[:-5])
+                    for entry in entries
+                    if entry.name.endswith(".yaml") and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+        # Reading the files dominates for larger audits, so overlap it in threads
+        if len(issue_files) > _PARALLEL_PARSE_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=min(_MAX_PARSE_WORKERS, len(issue_files))) as executor:
+                detections = list(executor.map(self._parse_issue_file, *zip(*issue_files)))
+        else:
+            detections = [self._parse_issue_file(issue_file, issue_stem) for issue_file, issue_stem in issue_files]
+
+        return [detection for detection in detections if detection is not None]
+
+    def _parse_issue_file(self, issue_file: str, issue_stem: str) -> Optional[AuditDetection]:
+        """Parse a single issues/*.yaml file, returning None if it is unusable."""
+        try:
+            # Load the YAML file (read in one call rather than streamed by the loader)
+            with open(issue_file, 'rb') as f:
+                issue_data = yaml.load(f.read(), Loader=_YAML_LOADER)
+
+            if not isinstance(issue_data, dict):
+                return None
+
+            # Extract basic fields
+            name = issue_data.get('name', issue_stem)
+            impact = issue_data.get('impact', 'medium')
+            confidence = issue_data.get('confidence', 'medium')
+            detection_type = issue_data.get('detection_type', 'N/A')
+
+            # Parse location
+            location = None
+            if 'location' in issue_data and isinstance(issue_data['location'], dict):
+                loc = issue_data['location']
+                location = Location(
+                    target=loc.get('target', 'Unknown'),
+                    file_path=Path(loc['file']) if 'file' in loc else None,
+                    start_line=loc.get('start_line'),
+                    end_line=loc.get('end_line'),
+                    source_snippet=loc.get('code_snippet')
                 )
 
-                results.append(detection)
-
-            except yaml.YAMLError as e:
-                # Skip files that can't be parsed
-                print(f"Error parsing YAML file {issue_file}: {e}")
-                continue
-            except Exception as e:
-                # Skip other errors
-                print(f"Error processing issue file {issue_file}: {e}")
-                continue
-
-        return results
+            # Get content fields (with markdown/asciidoc content)
+            description_text = issue_data.get('description', 'No description provided')
+            recommendation = issue_data.get('recommendation', '')
+            exploit = issue_data.get('exploit', '')
+
+            # Create the audit detection
+            detection = AuditDetection(
+                name=name,
+                impact=impact,
+                confidence=confidence,
+                detection_type=detection_type,
+                source="audit",  # Automatically set to workflow name
+                location=location,
+                description=description_text,
+                recommendation=recommendation,
+                exploit=exploit
+            )
+
+            return detection
+
+        except yaml.YAMLError as e:
+            # Skip files that can't be parsed
+            print(f"Error parsing YAML file {issue_file}: {e}")
+        except Exception as e:
+            # Skip other errors
+            print(f"Error processing issue file {issue_file}: {e}")
+        return None
 
     def _parse_adoc_file(self, file_path: Path) -> Dict[str, str]:
         """Parse an AsciiDoc file and extract sections."""
@@ -155,7 +180,7 @@ class AuditResult(AIResult):
         current_section = None
         current_content = []
 
-        for line in content.split('\n'):
+        for line in content.splitlines():
             if line.startswith('== '):
                 if current_section:
                     sections[current_section] = '\n'.join(current_content).strip()
@@ -182,12 +207,12 @@ class AuditResult(AIResult):
         # Parse executive summary
         executive_summary_file = working_dir / "executive-summary.md"
         if executive_summary_file.exists():
-            metadata["executive_summary"] = executive_summary_file.read_text()
+            metadata["executive_summary"] = executive_summary_file.read_bytes().decode("utf-8")
 
         # Parse project overview
         overview_file = working_dir / "overview.md"
         if overview_file.exists():
-            metadata["project_overview"] = overview_file.read_text()
+            metadata["project_overview"] = overview_file.read_bytes().decode("utf-8")
 
         # Skip parsing audit plan - not needed in exported metadata
 
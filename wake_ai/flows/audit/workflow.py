@@ -1,7 +1,9 @@
 """Security audit workflow implementation."""
 
+import os
+import re
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, FrozenSet
 import yaml
 
 import rich_click as click
@@ -9,14 +11,64 @@ import rich_click as click
 from wake_ai import workflow
 from wake_ai.core.flow import AIWorkflow, ClaudeCodeResponse, AIResult
 
-# Valid detection types for audit findings
-VALID_DETECTION_TYPES = [
+from .result import AuditResult
+
+# Prefer the libyaml-backed loader when available (same output as safe_load)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Context placeholders substituted into the audit prompts by _build_prompt
+_PLACEHOLDER_PATTERN = re.compile(r"\{(scope_files|context_docs|focus_areas)\}")
+
+# Stop scanning plan.yaml once this many errors have been reported; the retry
+# prompt gains nothing from hundreds of near-identical messages
+_MAX_ERRORS = 20
+
+# Required fields for plan.yaml issues, issue files and their locations
+# (tuples keep the reporting order, frozensets are used for the checks)
+_ISSUE_FIELDS = ("title", "status", "location", "description", "impact", "confidence")
+_ISSUE_REQUIRED: FrozenSet[str] = frozenset(_ISSUE_FIELDS)
+_ISSUE_FILE_FIELDS = ("name", "impact", "confidence", "detection_type", "location", "description", "recommendation")
+_ISSUE_FILE_REQUIRED: FrozenSet[str] = frozenset(_ISSUE_FILE_FIELDS)
+_LOC_FIELDS = ("file", "start_line", "end_line")
+_LOC_REQUIRED: FrozenSet[str] = frozenset(_LOC_FIELDS)
+
+# Sections required in overview.md
+_OVERVIEW_REQUIRED_SECTIONS = ("# Codebase Overview", "## Architecture", "## Key Components", "## Actors")
+_OVERVIEW_SECTION_PATTERN = re.compile("|".join(map(re.escape, _OVERVIEW_REQUIRED_SECTIONS)))
+
+# Markdown tokens required in executive-summary.md
+_SUMMARY_REQUIRED_SECTIONS = (
+    "# Executive Summary",
+    "## Audit Overview",
+    "## Summary of Findings",
+    "## Key Technical Findings",
+)
+_SUMMARY_TABLE_HEADERS = ("| Impact", "| High Confidence", "| Medium Confidence", "| Low Confidence", "| Total")
+_SUMMARY_TABLE_SEPARATOR = "|---"
+_SUMMARY_TOKEN_PATTERN = re.compile(
+    "|".join(
+        re.escape(token)
+        for token in (*_SUMMARY_REQUIRED_SECTIONS, *_SUMMARY_TABLE_HEADERS, _SUMMARY_TABLE_SEPARATOR)
+    )
+)
+
+# Prompt file contents shared across AuditWorkflow instances, keyed by path
+# and invalidated when the file's mtime changes
+_PROMPT_CACHE: Dict[Path, Tuple[float, str]] = {}
+
+# Valid detection types for audit findings (ordered for error messages)
+VALID_DETECTION_TYPES_DISPLAY = (
     "Data validation", "Code quality", "Logic error", "Standards violation",
     "Gas optimization", "Logging", "Trust model", "Arithmetics",
     "Access control", "Unused code", "Storage clashes", "Denial of service",
     "Front-running", "Replay attack", "Reentrancy", "Function visibility",
     "Overflow/Underflow", "Configuration", "Reinitialization", "Griefing", "N/A"
-]
+)
+VALID_DETECTION_TYPES: FrozenSet[str] = frozenset(VALID_DETECTION_TYPES_DISPLAY)
+
+# Valid impact and confidence values for plan.yaml issues
+_VALID_IMPACTS: FrozenSet[str] = frozenset({"high", "medium", "low", "info", "warning"})
+_VALID_CONFIDENCES: FrozenSet[str] = frozenset({"high", "medium", "low"})
 
 
 @workflow.command(name="audit")
@@ -26,9 +78,10 @@ VALID_DETECTION_TYPES = [
 def factory(scope: List[str], context: List[str], focus: List[str]):
     """Run audit workflow."""
     workflow = AuditWorkflow()
-    workflow.scope_files = scope
-    workflow.context_docs = context
-    workflow.focus_areas = focus
+    # Drop repeated entries so they are not sent to Claude twice
+    workflow.scope_files = list(dict.fromkeys(scope))
+    workflow.context_docs = list(dict.fromkeys(context))
+    workflow.focus_areas = list(dict.fromkeys(focus))
 
     # Add context after parent init (which creates self.state)
     workflow.add_context("scope_files", workflow.scope_files)
@@ -50,15 +103,13 @@ class AuditWorkflow(AIWorkflow):
 
     def __init__(self):
         """Initialize security audit workflow."""
-        super().__init__()
+        super().__init__(result_class=AuditResult)
 
         # Load prompts from markdown files before parent init
         self._load_prompts()
-
-        # Import result class
-        from .result import AuditResult
-
-        self.result_class = AuditResult
+        self._plan_cache: Dict[Tuple[str, int, int], Any] = {}
+        # Joined scope, context and focus strings, set by execute() before the steps are built
+        self._context_values: Dict[str, str] = {}
 
     def _load_prompts(self):
         """Load audit prompts from markdown files."""
@@ -75,11 +126,17 @@ class AuditWorkflow(AIWorkflow):
 
         for key, filename in prompt_files:
             prompt_path = prompts_dir / filename
-            if prompt_path.exists():
-                self.prompts[key] = prompt_path.read_text()
-            else:
+            try:
+                mtime = prompt_path.stat().st_mtime
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Audit prompt not found: {prompt_path}")
 
+            cached = _PROMPT_CACHE.get(prompt_path)
+            if cached is None or cached[0] != mtime:
+                cached = (mtime, prompt_path.read_bytes().decode("utf-8"))
+                _PROMPT_CACHE[prompt_path] = cached
+            self.prompts[key] = cached[1]
+
     def _setup_steps(self):
         """Setup the fixed audit workflow steps."""
 
@@ -127,15 +184,26 @@ class AuditWorkflow(AIWorkflow):
             max_retry_cost=5.0
         )
 
+    def _load_plan(self, plan_file: Path) -> Any:
+        """Load plan.yaml, reusing the parsed data while the file is unchanged."""
+        stat = plan_file.stat()
+        cache_key = (str(plan_file), stat.st_mtime_ns, stat.st_size)
+        if cache_key not in self._plan_cache:
+            with open(plan_file, 'rb') as f:
+                plan_data = yaml.load(f, Loader=_YAML_LOADER)
+            # Only the latest version of the plan is worth keeping
+            self._plan_cache = {cache_key: plan_data}
+        return self._plan_cache[cache_key]
+
     def _validate_initialize(self, response: ClaudeCodeResponse) -> Tuple[bool, List[str]]:
         """Validate initialization step - check if wake init was successful."""
         errors = []
 
         # Check if wake.toml exists (created by wake init)
-        wake_config = Path(self.execution_dir) / "wake.toml"
+        wake_config = self.execution_dir / "wake.toml"
         if not wake_config.exists():
             # Check in parent directory too as wake might be initialized there
-            parent_wake_config = Path(self.execution_dir).parent / "wake.toml"
+            parent_wake_config = self.execution_dir.parent / "wake.toml"
             if not parent_wake_config.exists():
                 errors.append("wake.toml not found - wake init may have failed")
 
@@ -146,25 +214,23 @@ class AuditWorkflow(AIWorkflow):
         errors = []
 
         # Check for overview.md
-        overview_file = Path(self.working_dir) / "overview.md"
+        overview_file = self.working_dir / "overview.md"
         if not overview_file.exists():
             errors.append(f"Overview file not created at {overview_file}")
         else:
-            content = overview_file.read_text()
-            required_sections = ["# Codebase Overview", "## Architecture", "## Key Components", "## Actors"]
-            for section in required_sections:
-                if section not in content:
+            content = overview_file.read_bytes().decode("utf-8")
+            found = set(_OVERVIEW_SECTION_PATTERN.findall(content))
+            for section in _OVERVIEW_REQUIRED_SECTIONS:
+                if section not in found:
                     errors.append(f"Missing required section '{section}' in {overview_file}")
 
         # Check for plan.yaml
-        plan_file = Path(self.working_dir) / "plan.yaml"
+        plan_file = self.working_dir / "plan.yaml"
         if not plan_file.exists():
             errors.append(f"Plan file not created at {plan_file}")
         else:
             try:
-                # Load YAML directly
-                with open(plan_file, 'r') as f:
-                    plan_data = yaml.safe_load(f)
+                plan_data = self._load_plan(plan_file)
 
                 # Validate YAML schema
                 if 'contracts' not in plan_data:
@@ -176,29 +242,44 @@ class AuditWorkflow(AIWorkflow):
                         if 'issues' not in contract:
                             errors.append(f"Contract {i} missing 'issues' field")
                         else:
+                            # Bind the label once per contract instead of per error
+                            contract_name = contract.get('name', i)
                             for j, issue in enumerate(contract['issues']):
-                                required_fields = ['title', 'status', 'location', 'description', 'impact', 'confidence']
-                                for field in required_fields:
-                                    if field not in issue:
-                                        errors.append(f"Contract {contract.get('name', i)} issue {j} missing '{field}' field")
+                                if not isinstance(issue, dict):
+                                    errors.append(f"Contract {contract_name} issue {j} should be a mapping")
+                                    continue
+
+                                missing = _ISSUE_REQUIRED - issue.keys()
+                                if missing:
+                                    for field in _ISSUE_FIELDS:
+                                        if field in missing:
+                                            errors.append(f"Contract {contract_name} issue {j} missing '{field}' field")
 
                                 # Validate location structure
                                 if 'location' in issue:
                                     loc = issue['location']
                                     if 'lines' not in loc and 'function' not in loc:
-                                        errors.append(f"Contract {contract.get('name', i)} issue {j} location missing 'lines' or 'function'")
+                                        errors.append(f"Contract {contract_name} issue {j} location missing 'lines' or 'function'")
 
                                 # Validate impact values
-                                if 'impact' in issue and issue['impact'] not in ['high', 'medium', 'low', 'info', 'warning']:
-                                    errors.append(f"Contract {contract.get('name', i)} issue {j} has invalid impact: {issue['impact']}")
+                                if 'impact' in issue:
+                                    impact = issue['impact']
+                                    if not (isinstance(impact, str) and impact in _VALID_IMPACTS):
+                                        errors.append(f"Contract {contract_name} issue {j} has invalid impact: {impact}")
 
                                 # Validate confidence values
-                                if 'confidence' in issue and issue['confidence'] not in ['high', 'medium', 'low']:
-                                    errors.append(f"Contract {contract.get('name', i)} issue {j} has invalid confidence: {issue['confidence']}")
+                                if 'confidence' in issue:
+                                    confidence = issue['confidence']
+                                    if not (isinstance(confidence, str) and confidence in _VALID_CONFIDENCES):
+                                        errors.append(f"Contract {contract_name} issue {j} has invalid confidence: {confidence}")
 
                                 # Validate status
                                 if 'status' in issue and issue['status'] != 'pending':
-                                    errors.append(f"Contract {contract.get('name', i)} issue {j} should have status 'pending', not '{issue['status']}'")
+                                    errors.append(f"Contract {contract_name} issue {j} should have status 'pending', not '{issue['status']}'")
+
+                                if len(errors) >= _MAX_ERRORS:
+                                    errors.append(f"... (further errors in {plan_file} truncated)")
+                                    return (False, errors)
 
             except yaml.YAMLError as e:
                 errors.append(f"Invalid YAML in {plan_file}: {str(e)}")
@@ -212,72 +293,80 @@ class AuditWorkflow(AIWorkflow):
         errors = []
 
         # Check that plan.yaml still exists and has been updated
-        plan_file = Path(self.working_dir) / "plan.yaml"
+        plan_file = self.working_dir / "plan.yaml"
         if not plan_file.exists():
             errors.append(f"Plan file missing at {plan_file}")
         else:
             try:
-                # Load YAML directly
-                with open(plan_file, 'r') as f:
-                    plan_data = yaml.safe_load(f)
+                plan_data = self._load_plan(plan_file)
 
                 # Check that statuses have been updated from 'pending'
                 has_validated_issues = False
                 true_positives = []
 
                 for contract in plan_data.get('contracts', []):
+                    contract_name = contract.get('name')
                     for issue in contract.get('issues', []):
                         status = issue.get('status', '')
                         if status in ['true_positive', 'false_positive']:
                             has_validated_issues = True
                             if status == 'true_positive':
-                                true_positives.append((contract.get('name'), issue))
+                                true_positives.append((contract_name, issue))
 
                         # Check for comment field when validated
                         if status != 'pending' and 'comment' not in issue:
                             errors.append(f"Issue '{issue.get('title')}' in {plan_file} missing validation comment")
+                            if len(errors) >= _MAX_ERRORS:
+                                errors.append(f"... (further errors in {plan_file} truncated)")
+                                return (False, errors)
 
                 if not has_validated_issues:
                     errors.append(f"No issues have been validated in {plan_file} (all still pending)")
 
                 # Check for issue files for true positives
-                issues_dir = Path(self.working_dir) / "issues"
+                issues_dir = self.working_dir / "issues"
                 if true_positives and not issues_dir.exists():
                     errors.append(f"Issues directory not created at {issues_dir}")
                 elif true_positives:
                     # Check that at least some issue files exist
-                    yaml_files = list(issues_dir.glob("*.yaml"))
+                    # DirEntry keeps the file type from the directory listing, so no extra stat per file
+                    with os.scandir(issues_dir) as entries:
+                        yaml_files = [
+                            entry for entry in entries
+                            if entry.name.endswith(".yaml") and entry.is_file(follow_symlinks=False)
+                        ]
                     if len(yaml_files) == 0:
                         errors.append(f"No issue files (*.yaml) created for true positive findings in {issues_dir}")
                     else:
                         # Validate YAML file structure
                         for yaml_file in yaml_files[:3]:  # Check first 3 files as samples
                             try:
-                                with open(yaml_file, 'r') as f:
-                                    issue_data = yaml.safe_load(f)
+                                # Read the whole file at once rather than letting the loader stream it
+                                with open(yaml_file, 'rb') as f:
+                                    issue_data = yaml.load(f.read(), Loader=_YAML_LOADER)
 
                                 if not isinstance(issue_data, dict):
                                     errors.append(f"Issue file {yaml_file.name} is not a valid YAML dictionary")
                                     continue
 
                                 # Check for required fields
-                                required_fields = ['name', 'impact', 'confidence', 'detection_type', 'location', 'description', 'recommendation']
-                                missing_fields = [field for field in required_fields if field not in issue_data]
-                                if missing_fields:
+                                missing = _ISSUE_FILE_REQUIRED - issue_data.keys()
+                                if missing:
+                                    missing_fields = [field for field in _ISSUE_FILE_FIELDS if field in missing]
                                     errors.append(f"Issue file {yaml_file.name} missing fields: {', '.join(missing_fields)}")
 
                                 # Validate detection_type
                                 if 'detection_type' in issue_data:
                                     detection_type = issue_data['detection_type']
-                                    if detection_type not in VALID_DETECTION_TYPES:
-                                        errors.append(f"Issue file {yaml_file.name} has invalid detection_type '{detection_type}'. Valid types are: {', '.join(VALID_DETECTION_TYPES)}")
+                                    if not (isinstance(detection_type, str) and detection_type in VALID_DETECTION_TYPES):
+                                        errors.append(f"Issue file {yaml_file.name} has invalid detection_type '{detection_type}'. Valid types are: {', '.join(VALID_DETECTION_TYPES_DISPLAY)}")
 
                                 # Validate location structure
                                 if 'location' in issue_data and isinstance(issue_data['location'], dict):
                                     loc = issue_data['location']
-                                    loc_required = ['file', 'start_line', 'end_line']
-                                    loc_missing = [field for field in loc_required if field not in loc]
-                                    if loc_missing:
+                                    missing = _LOC_REQUIRED - loc.keys()
+                                    if missing:
+                                        loc_missing = [field for field in _LOC_FIELDS if field in missing]
                                         errors.append(f"Issue file {yaml_file.name} location missing: {', '.join(loc_missing)}")
 
                             except yaml.YAMLError as e:
@@ -297,32 +386,28 @@ class AuditWorkflow(AIWorkflow):
         errors = []
 
         # Check for executive-summary.md
-        summary_file = Path(self.working_dir) / "executive-summary.md"
+        summary_file = self.working_dir / "executive-summary.md"
         if not summary_file.exists():
             errors.append(f"Executive summary not created at {summary_file}")
         else:
-            content = summary_file.read_text()
-            required_sections = [
-                "# Executive Summary",
-                "## Audit Overview",
-                "## Summary of Findings",
-                "## Key Technical Findings"
-            ]
-
-            for section in required_sections:
-                if section not in content:
+            content = summary_file.read_bytes().decode("utf-8")
+
+            # Collect every required section, table header and separator in one scan
+            found = set(_SUMMARY_TOKEN_PATTERN.findall(content))
+
+            for section in _SUMMARY_REQUIRED_SECTIONS:
+                if section not in found:
                     errors.append(f"Missing required section '{section}' in {summary_file}")
 
             # Check for the EXACT table format from the prompt
-            table_headers = ["| Impact", "| High Confidence", "| Medium Confidence", "| Low Confidence", "| Total"]
-            if not all(header in content for header in table_headers):
+            if not found.issuperset(_SUMMARY_TABLE_HEADERS):
                 errors.append(
                     f"Missing findings summary table in {summary_file}. The executive summary must include a table with "
                     "this exact header row: | Impact | High Confidence | Medium Confidence | Low Confidence | Total |"
                 )
 
             # Also check for table separator line
-            if "| Impact" in content and not any("|---" in line for line in content.split('\n') if "---" in line):
+            if "| Impact" in found and _SUMMARY_TABLE_SEPARATOR not in found:
                 errors.append(
                     f"Findings table missing separator line in {summary_file}. Tables must have a separator line "
                     "like |----------|----------------|-------------------|----------------|-------|"
@@ -334,34 +419,37 @@ class AuditWorkflow(AIWorkflow):
 
         return (len(errors) == 0, errors)
 
+    def _join_context_values(self) -> Dict[str, str]:
+        """Join the scope, context and focus lists into the strings used in prompts."""
+        return {
+            "scope_files": ', '.join(self.scope_files) if self.scope_files else 'entire codebase',
+            "context_docs": ', '.join(self.context_docs) if self.context_docs else 'none',
+            "focus_areas": ', '.join(self.focus_areas) if self.focus_areas else 'general security audit',
+        }
+
     def _build_prompt(self, step_name: str) -> str:
-        """Build prompt with context variables."""
-        base_prompt = self.prompts[step_name]
-
-        # Add context variables to the prompt
-        context_section = ""
-        if step_name in ["analyze_and_plan", "executive_summary"]:
-            context_section = f"\n<context>\nScope: {', '.join(self.scope_files) if self.scope_files else 'entire codebase'}\n"
-            context_section += f"Context: {', '.join(self.context_docs) if self.context_docs else 'none'}\n"
-            context_section += f"Focus: {', '.join(self.focus_areas) if self.focus_areas else 'general security audit'}\n</context>\n"
-
-        # Replace context placeholders if they exist
-        if "{scope_files}" in base_prompt:
-            base_prompt = base_prompt.replace("{scope_files}", ', '.join(self.scope_files) if self.scope_files else 'entire codebase')
-        if "{context_docs}" in base_prompt:
-            base_prompt = base_prompt.replace("{context_docs}", ', '.join(self.context_docs) if self.context_docs else 'none')
-        if "{focus_areas}" in base_prompt:
-            base_prompt = base_prompt.replace("{focus_areas}", ', '.join(self.focus_areas) if self.focus_areas else 'general security audit')
-
-        return base_prompt
+        """Build prompt with context variables.
+
+        Uses the context strings joined by execute().
+        """
+        values = self._context_values
+
+        # Replace context placeholders in a single pass over the prompt
+        return _PLACEHOLDER_PATTERN.sub(lambda m: values[m.group(1)], self.prompts[step_name])
 
     def execute(self, context: Optional[Dict[str, Any]] = None, **kwargs) -> Tuple[Dict[str, Any], AIResult]:
         """Execute the audit workflow with proper context setup."""
+        # Never carry a parsed plan over from a previous run
+        self._plan_cache.clear()
+
+        # Join the context lists once per run; _build_prompt reads them while the steps are set up
+        self._context_values = values = self._join_context_values()
+
         # Initialize context with audit-specific information
         audit_context = {
-            "scope": ', '.join(self.scope_files) if self.scope_files else 'entire codebase',
-            "additional_context": ', '.join(self.context_docs) if self.context_docs else 'none',
-            "focus_areas": ', '.join(self.focus_areas) if self.focus_areas else "general security audit"
+            "scope": values["scope_files"],
+            "additional_context": values["context_docs"],
+            "focus_areas": values["focus_areas"],
         }
 
         if context:
@@ -3,18 +3,7 @@
 from wake_ai import workflow
 from wake_ai.templates import SimpleDetector
 
-@workflow.command(name="reentrancy")
-def factory():
-    """Run reentrancy detector."""
-    return ReentrancyDetector()
-
-
-class ReentrancyDetector(SimpleDetector):
-    """Enhanced reentrancy detector that leverages Wake's static analysis."""
-
-    def get_detector_prompt(self) -> str:
-        """Define the reentrancy detection workflow."""
-        return """# Reentrancy Vulnerability Analysis
+_REENTRANCY_PROMPT = """# Reentrancy Vulnerability Analysis
 
 ## Task
 Perform comprehensive reentrancy vulnerability analysis by combining Wake's static analysis with manual verification to identify exploitable vulnerabilities.
@@ -35,4 +24,18 @@ Perform comprehensive reentrancy vulnerability analysis by combining Wake's stat
 ## Validation Criteria
 - Verify callbacks are possible and state changes occur after external calls
 - Eliminate false positives by confirming actual exploitability
-- Provide specific attack vectors, not theoretical possibilities"""
\ No newline at end of file
+- Provide specific attack vectors, not theoretical possibilities"""
+
+
+@workflow.command(name="reentrancy")
+def factory():
+    """Run reentrancy detector."""
+    return ReentrancyDetector()
+
+
+class ReentrancyDetector(SimpleDetector):
+    """Enhanced reentrancy detector that leverages Wake's static analysis."""
+
+    def get_detector_prompt(self) -> str:
+        """Define the reentrancy detection workflow."""
+        return _REENTRANCY_PROMPT
@@ -9,40 +9,13 @@ from wake_ai.templates.simple_detector import SimpleDetector
 import rich_click as click
 
 
-@workflow.command(name="uniswap")
-@click.option("--focus-version", "-f", type=click.Choice(["v2", "v3", "both"]), default="both", help="Uniswap version to focus on")
-@click.option("--no-oracle-check", is_flag=True, help="Skip price oracle manipulation checks")
-@click.option("--no-sandwich-check", is_flag=True, help="Skip sandwich attack protection checks")
-def factory(focus_version: str, no_oracle_check: bool, no_sandwich_check: bool):
-    """Run Uniswap integration detector."""
-    detector = UniswapDetector()
-    detector.focus_version = focus_version
-    detector.check_oracle_manipulation = not no_oracle_check
-    detector.check_sandwich_protection = not no_sandwich_check
-    return detector
-
-
-class UniswapDetector(SimpleDetector):
-    """Detector for Uniswap V2/V3 specific vulnerabilities and best practices."""
-
-    focus_version: str
-    check_oracle_manipulation: bool
-    check_sandwich_protection: bool
-
-    def get_detector_prompt(self) -> str:
-        """Get the Uniswap-specific detection prompt."""
-        version_context = ""
-        if self.focus_version == "v2":
-            version_context = "Focus specifically on Uniswap V2 patterns and interfaces."
-        elif self.focus_version == "v3":
-            version_context = "Focus specifically on Uniswap V3 patterns including concentrated liquidity."
-        else:
-            version_context = "Check for both Uniswap V2 and V3 patterns."
-
-        prompt = f"""# Uniswap Integration Security Analysis
+# Prompt sections, assembled by UniswapDetector.get_detector_prompt
+_INTRO = """# Uniswap Integration Security Analysis
 
 This detector identifies vulnerabilities in contracts that integrate with Uniswap, including DEX aggregators, yield farms, lending protocols, and other DeFi applications.
-{version_context}
+"""
+
+_CORE_SECTIONS = """
 
 1. **Initialize and identify Uniswap integrations**
    - Scan for Uniswap interface imports (IUniswapV2*, IUniswapV3*)
@@ -77,8 +50,7 @@ This detector identifies vulnerabilities in contracts that integrate with Uniswa
       - Check for proper LP share valuation methods
 """
 
-        if self.check_oracle_manipulation:
-            prompt += """
+_ORACLE_SECTION = """
 4. **Price oracle security analysis**
 
    a) **TWAP implementation review**
@@ -94,7 +66,7 @@ This detector identifies vulnerabilities in contracts that integrate with Uniswa
       - Analyze multi-hop price calculations
 """
 
-        prompt += """
+_FLASH_LOAN_SECTION = """
 5. **Flash loan and callback security**
 
    a) **Callback function protection**
@@ -112,8 +84,7 @@ This detector identifies vulnerabilities in contracts that integrate with Uniswa
 6. **Protocol-specific vulnerability patterns**
 """
 
-        if self.focus_version in ["v3", "both"]:
-            prompt += """
+_V3_SECTION = """
    a) **Uniswap V3 specific issues**
       - Verify tick math calculations and boundaries
       - Check for liquidity range manipulation
@@ -122,8 +93,7 @@ This detector identifies vulnerabilities in contracts that integrate with Uniswa
       - Test edge cases at tick boundaries
 """
 
-        if self.check_sandwich_protection:
-            prompt += """
+_SANDWICH_SECTION = """
    b) **MEV and sandwich protection**
       - Identify transactions vulnerable to sandwiching
       - Check for commit-reveal patterns where needed
@@ -131,7 +101,7 @@ This detector identifies vulnerabilities in contracts that integrate with Uniswa
       - Verify private mempool usage for sensitive operations
 """
 
-        prompt += """
+_BEST_PRACTICES_SECTION = """
 7. **Integration best practices audit**
 
    a) **Address and configuration management**
@@ -154,4 +124,44 @@ This detector identifies vulnerabilities in contracts that integrate with Uniswa
 Only report objective security vulnerabilities. Do not report any issues if the implementation meets established security best practices and does not violate known standards or introduce exploitable conditions.
 """
 
-        return prompt
+
+@workflow.command(name="uniswap")
+@click.option("--focus-version", "-f", type=click.Choice(["v2", "v3", "both"]), default="both", help="Uniswap version to focus on")
+@click.option("--no-oracle-check", is_flag=True, help="Skip price oracle manipulation checks")
+@click.option("--no-sandwich-check", is_flag=True, help="Skip sandwich attack protection checks")
+def factory(focus_version: str, no_oracle_check: bool, no_sandwich_check: bool):
+    """Run Uniswap integration detector."""
+    detector = UniswapDetector()
+    detector.focus_version = focus_version
+    detector.check_oracle_manipulation = not no_oracle_check
+    detector.check_sandwich_protection = not no_sandwich_check
+    return detector
+
+
+class UniswapDetector(SimpleDetector):
+    """Detector for Uniswap V2/V3 specific vulnerabilities and best practices."""
+
+    focus_version: str
+    check_oracle_manipulation: bool
+    check_sandwich_protection: bool
+
+    def get_detector_prompt(self) -> str:
+        """Get the Uniswap-specific detection prompt."""
+        if self.focus_version == "v2":
+            version_context = "Focus specifically on Uniswap V2 patterns and interfaces."
+        elif self.focus_version == "v3":
+            version_context = "Focus specifically on Uniswap V3 patterns including concentrated liquidity."
+        else:
+            version_context = "Check for both Uniswap V2 and V3 patterns."
+
+        parts = [_INTRO, version_context, _CORE_SECTIONS]
+        if self.check_oracle_manipulation:
+            parts.append(_ORACLE_SECTION)
+        parts.append(_FLASH_LOAN_SECTION)
+        if self.focus_version in ("v3", "both"):
+            parts.append(_V3_SECTION)
+        if self.check_sandwich_protection:
+            parts.append(_SANDWICH_SECTION)
+        parts.append(_BEST_PRACTICES_SECTION)
+
+        return "".join(parts)
@@ -2,12 +2,16 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, TYPE_CHECKING
-import json
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING
+
+from .utils.common import dumps_json
 
 if TYPE_CHECKING:
     from rich.console import Console
 
+# Longest value shown per row by SimpleResult.pretty_print (full data stays in to_dict)
+MAX_DISPLAY_VALUE_LENGTH = 512
+
 
 class AIResult(ABC):
     """Base class for AI workflow results.
@@ -16,6 +20,9 @@ class AIResult(ABC):
     This allows each workflow to define its own result structure and formatting.
     """
 
+    # Lets subclasses that declare __slots__ drop the per-instance __dict__
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def from_working_dir(cls, working_dir: Path, raw_results: Dict[str, Any]) -> "AIResult":
@@ -48,7 +55,7 @@ class AIResult(ABC):
         """
         data = self.to_dict()
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, indent=2))
+        path.write_bytes(dumps_json(data))
 
 
 class SimpleResult(AIResult):
@@ -78,11 +85,21 @@ class SimpleResult(AIResult):
         table.add_column("Key", style="cyan")
         table.add_column("Value")
 
-        for key, value in self.data.items():
-            table.add_row(key, str(value))
+        for key, value in self._table_rows():
+            table.add_row(key, value)
 
         console.print(table)
 
+    def _table_rows(self) -> List[Tuple[str, str]]:
+        """Stringify the data for display, truncating very long values."""
+        rows = []
+        for key, value in self.data.items():
+            value_str = str(value)
+            if len(value_str) > MAX_DISPLAY_VALUE_LENGTH:
+                value_str = value_str[:MAX_DISPLAY_VALUE_LENGTH] + "…"
+            rows.append((str(key), value_str))
+        return rows
+
     def to_dict(self) -> Dict[str, Any]:
         """Return the data as-is."""
         return self.data
@@ -1,8 +1,20 @@
 """Templates for creating specialized AI workflows."""
 
-from .simple_detector import SimpleDetector, SimpleDetectorResult
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .simple_detector import SimpleDetector, SimpleDetectorResult
 
 __all__ = [
     "SimpleDetector",
     "SimpleDetectorResult",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    # Import template modules (and the workflow engine they build on) on first use
+    if name in __all__:
+        from . import simple_detector
+
+        return getattr(simple_detector, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
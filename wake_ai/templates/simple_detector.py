@@ -2,8 +2,7 @@
 
 from abc import abstractmethod
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
-import yaml
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 from ..core.flow import AIWorkflow, ClaudeCodeResponse
 from ..detections import Detection, Location, Severity
@@ -12,169 +11,59 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-
-class SimpleDetectorResult(AIResult):
-    """Result class for simple detector workflows."""
-
-    def __init__(self, detections: List[Tuple[str, Detection]], working_dir: Path):
-        """Initialize with detections and working directory."""
-        self.detections = detections
-        self.working_dir = working_dir
-
-    @classmethod
-    def from_working_dir(cls, working_dir: Path, raw_results: Dict[str, Any]) -> "SimpleDetectorResult":
-        """Parse detector results from the simplified results.yaml format."""
-        # Create instance first with empty detections
-        instance = cls([], working_dir)
-
-        # Parse results.yaml directly
-        results_file = working_dir / "results.yaml"
-        detections = []
-
-        if results_file.exists():
-            try:
-                with open(results_file, 'r') as f:
-                    data = yaml.safe_load(f)
-
-                detector_name = raw_results.get('workflow', 'simple-detector')
-
-                for detection_data in data.get('detections', []):
-                    # Parse location if present
-                    location = None
-                    if 'location' in detection_data:
-                        loc = detection_data['location']
-                        location = Location(
-                            target=loc.get('target', 'Unknown'),
-                            file_path=Path(loc['file']) if 'file' in loc else None,
-                            start_line=loc.get('start_line'),
-                            end_line=loc.get('end_line'),
-                            source_snippet=loc.get('snippet')
-                        )
-
-                    # Map severity
-                    severity_str = detection_data.get('severity', 'medium').lower()
-                    severity_map = {
-                        'info': Severity.INFO,
-                        'warning': Severity.WARNING,
-                        'low': Severity.LOW,
-                        'medium': Severity.MEDIUM,
-                        'high': Severity.HIGH,
-                        'critical': Severity.CRITICAL
-                    }
-                    severity = severity_map.get(severity_str, Severity.MEDIUM)
-
-                    detection = Detection(
-                        name=detection_data.get('title', 'Unnamed Detection'),
-                        severity=severity,
-                        detection_type=detection_data.get('type', 'vulnerability'),
-                        location=location,
-                        description=detection_data.get('description', ''),
-                        recommendation=detection_data.get('recommendation'),
-                        exploit=detection_data.get('exploit')
-                    )
-                    detections.append((detector_name, detection))
-
-            except Exception as e:
-                logger.error(f"Failed to parse results.yaml: {e}")
-
-        # Set the parsed detections
-        instance.detections = detections
-        return instance
-
-    def pretty_print(self, console):
-        """Pretty print the detections to console."""
-        from ..utils.formatters import print_detection
-
-        if not self.detections:
-            console.print("[yellow]No detections found.[/yellow]")
-            return
-
-        console.print(f"\n[bold]Found {len(self.detections)} detection(s):[/bold]")
-
-        for detector_name, detection in self.detections:
-            print_detection(
-                detector_name=detector_name,
-                detection=detection,
-                console=console
-            )
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert detections to dictionary format."""
-        return {
-            "detections": [
-                {
-                    "detector": detector_name,
-                    **detection.to_dict()
-                }
-                for detector_name, detection in self.detections
-            ],
-            "working_directory": str(self.working_dir),
-            "total_detections": len(self.detections)
-        }
-
-    def export_json(self, output_path: Path):
-        """Export detections to JSON using the standard format."""
-        from ..utils.formatters import export_detections_json
-        export_detections_json(self.detections, output_path)
-
-
-class SimpleDetector(AIWorkflow):
-    """Abstract base class for simple detector workflows.
-
-    This class simplifies creating custom detectors by:
-    1. Providing a single abstract method to implement (get_detector_prompt)
-    2. Handling the workflow setup and validation automatically
-    3. Parsing results into standardized AIDetection format
-    """
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs, result_class=SimpleDetectorResult)
-
-    @abstractmethod
-    def get_detector_prompt(self) -> str:
-        """Get the detector-specific prompt.
-
-        This should return a prompt that describes:
-        1. What vulnerabilities/issues to look for
-        2. Any specific patterns or code smells
-        3. Context about the protocol/system being analyzed
-
-        The prompt will be wrapped with instructions to output to results.yaml.
-        """
-        pass
-
-    def _setup_steps(self):
-        """Setup the detector workflow with a single analysis step."""
-        # Get the detector-specific prompt
-        detector_prompt = self.get_detector_prompt()
-
-        # Wrap it with instructions for structured output
-        full_prompt = self._build_analysis_prompt(detector_prompt)
-
-        # Add single analysis step
-        # Using None for allowed_tools to inherit the secure defaults from AIWorkflow
-        self.add_step(
-            name="analyze",
-            prompt_template=full_prompt,
-            allowed_tools=None,  # Use parent class defaults which include all necessary tools
-            max_cost=20.0,
-            validator=self._validate_results,
-            max_retries=3,
-            max_retry_cost=10.0
-        )
-
-    def _build_analysis_prompt(self, detector_prompt: str) -> str:
-        """Build the full analysis prompt with output instructions."""
-        return f"""<context>
+# results.yaml schema values
+_REQUIRED_FIELDS = ("title", "severity", "type", "description")
+_VALID_SEVERITIES: FrozenSet[str] = frozenset({"critical", "high", "medium", "low", "info", "warning"})
+_VALID_TYPES: FrozenSet[str] = frozenset({"vulnerability", "gas-optimization", "best-practice", "code-quality"})
+_SEVERITY_MAP: Dict[str, Severity] = {
+    "info": Severity.INFO,
+    "warning": Severity.WARNING,
+    "low": Severity.LOW,
+    "medium": Severity.MEDIUM,
+    "high": Severity.HIGH,
+    "critical": Severity.CRITICAL,
+}
+
+# Last parsed results.yaml keyed by (path, mtime_ns, size)
+_RESULTS_CACHE: Dict[Tuple[str, int, int], Any] = {}
+
+# JSON schema accepted by the fastjsonschema fast path of _validate_results.
+# It is stricter than the hand-written checks (e.g. severity must already be
+# lowercase), so anything it rejects is re-checked to report detailed errors.
+_RESULTS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["detections"],
+    "properties": {
+        "detections": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": list(_REQUIRED_FIELDS),
+                "properties": {
+                    "severity": {"enum": sorted(_VALID_SEVERITIES)},
+                    "type": {"enum": sorted(_VALID_TYPES)},
+                    "location": {"type": "object", "required": ["target"]},
+                },
+            },
+        },
+    },
+}
+_RESULTS_SCHEMA_VALIDATOR: Optional[Callable[[Any], Any]] = None
+_RESULTS_SCHEMA_COMPILED = False
+
+# Fixed instructions wrapped around the detector prompt by _build_analysis_prompt
+_ANALYSIS_PROMPT_HEAD = """<context>
 You are a security auditor performing targeted vulnerability analysis. Your role is to identify real security issues with high confidence while avoiding false positives.
 
 </context>
 
 <task>
-{detector_prompt}
+"""
+_ANALYSIS_PROMPT_TAIL = """
 </task>
 
 <working_dir>
-{{{{working_dir}}}}
+{{working_dir}}
 </working_dir>
 
 <steps>
@@ -216,7 +105,7 @@ You are a security auditor performing targeted vulnerability analysis. Your role
 </validation_requirements>
 
 <output_format>
-Create `{{{{working_dir}}}}/results.yaml` with this structure:
+Create `{{working_dir}}/results.yaml` with this structure:
 
 ```yaml
 detections:
@@ -236,35 +125,35 @@ detections:
       start_line: 45
       end_line: 52
       snippet: |
-        function withdraw(uint256 amount) external {{
+        function withdraw(uint256 amount) external {
             require(balances[msg.sender] >= amount, "Insufficient balance");
 
             // Vulnerable: external call before state update
-            (bool success, ) = msg.sender.call{{value: amount}}("");
+            (bool success, ) = msg.sender.call{value: amount}("");
             require(success, "Transfer failed");
 
             balances[msg.sender] -= amount;  // State updated after call
-        }}
+        }
     exploit: |
         Consider the following exploit scenario:
         1. Alice deploys the ReentrancyAttack contract and calls attack() with 100 ETH.
       ```solidity
-      contract ReentrancyAttack {{
+      contract ReentrancyAttack {
           Vault public vault;
           uint256 public attackAmount;
 
-          function attack() external payable {{
+          function attack() external payable {
               attackAmount = msg.value;
-              vault.deposit{{value: msg.value}}();
+              vault.deposit{value: msg.value}();
               vault.withdraw(attackAmount);
-          }}
+          }
 
-          receive() external payable {{
-              if (address(vault).balance >= attackAmount) {{
+          receive() external payable {
+              if (address(vault).balance >= attackAmount) {
                   vault.withdraw(attackAmount);
-              }}
-          }}
-      }}
+              }
+          }
+      }
       ```
       2. Bob deposits 100 ETH into the Vault.
 
@@ -286,18 +175,216 @@ detections: []
 ```
 </output_format>"""
 
+
+def _load_results_yaml(results_file: Path) -> Any:
+    """Parse results.yaml with the libyaml loader when available.
+
+    The parsed data is kept while the file is unchanged, so validation and
+    result parsing share a single parse of the same file.
+    """
+    import yaml
+
+    stat = results_file.stat()
+    cache_key = (str(results_file), stat.st_mtime_ns, stat.st_size)
+    if cache_key not in _RESULTS_CACHE:
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(results_file.read_bytes(), Loader=loader)
+        # Only the most recently parsed file is worth keeping
+        _RESULTS_CACHE.clear()
+        _RESULTS_CACHE[cache_key] = data
+    return _RESULTS_CACHE[cache_key]
+
+
+def _get_results_schema_validator() -> Optional[Callable[[Any], Any]]:
+    """Compile the results schema on first use, if fastjsonschema is installed.
+
+    fastjsonschema is provided by the optional "speedups" extra.
+    """
+    global _RESULTS_SCHEMA_VALIDATOR, _RESULTS_SCHEMA_COMPILED
+
+    if not _RESULTS_SCHEMA_COMPILED:
+        _RESULTS_SCHEMA_COMPILED = True
+        try:
+            import fastjsonschema
+        except ImportError:
+            pass
+        else:
+            _RESULTS_SCHEMA_VALIDATOR = fastjsonschema.compile(_RESULTS_SCHEMA)
+    return _RESULTS_SCHEMA_VALIDATOR
+
+
+def _detection_from_yaml(detection_data: Dict[str, Any]) -> Detection:
+    """Convert a single results.yaml detection entry into a Detection."""
+    # Parse location if present
+    location = None
+    if 'location' in detection_data:
+        loc = detection_data['location']
+        location = Location(
+            target=loc.get('target', 'Unknown'),
+            file_path=Path(loc['file']) if 'file' in loc else None,
+            start_line=loc.get('start_line'),
+            end_line=loc.get('end_line'),
+            source_snippet=loc.get('snippet')
+        )
+
+    # Map severity, lowercasing only values that are not already canonical
+    severity_str = detection_data.get('severity', 'medium')
+    severity = _SEVERITY_MAP.get(severity_str)
+    if severity is None:
+        severity = _SEVERITY_MAP.get(severity_str.lower(), Severity.MEDIUM)
+
+    return Detection(
+        name=detection_data.get('title', 'Unnamed Detection'),
+        severity=severity,
+        detection_type=detection_data.get('type', 'vulnerability'),
+        location=location,
+        description=detection_data.get('description', ''),
+        recommendation=detection_data.get('recommendation'),
+        exploit=detection_data.get('exploit')
+    )
+
+
+class SimpleDetectorResult(AIResult):
+    """Result class for simple detector workflows."""
+
+    __slots__ = ("detections", "working_dir")
+
+    def __init__(self, detections: List[Tuple[str, Detection]], working_dir: Path):
+        """Initialize with detections and working directory."""
+        self.detections = detections
+        self.working_dir = working_dir
+
+    @classmethod
+    def from_working_dir(cls, working_dir: Path, raw_results: Dict[str, Any]) -> "SimpleDetectorResult":
+        """Parse detector results from the simplified results.yaml format."""
+        # Create instance first with empty detections
+        instance = cls([], working_dir)
+
+        # Parse results.yaml directly
+        results_file = working_dir / "results.yaml"
+        detector_name = raw_results.get('workflow', 'simple-detector')
+        detections = []
+
+        try:
+            # A missing results.yaml surfaces as FileNotFoundError from stat()
+            data = _load_results_yaml(results_file)
+
+            # A plain loop keeps the detections parsed before a malformed entry
+            for detection_data in data.get('detections') or ():
+                detections.append((detector_name, _detection_from_yaml(detection_data)))
+
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Failed to parse results.yaml: {e}")
+
+        # Set the parsed detections
+        instance.detections = detections
+        return instance
+
+    def pretty_print(self, console):
+        """Pretty print the detections to console."""
+        from ..utils.formatters import print_detections
+
+        if not self.detections:
+            console.print("[yellow]No detections found.[/yellow]")
+            return
+
+        console.print(f"\n[bold]Found {len(self.detections)} detection(s):[/bold]")
+
+        print_detections(self.detections, console)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert detections to dictionary format."""
+        detections = []
+        for detector_name, detection in self.detections:
+            # to_dict() returns a fresh dict, so it can be extended in place
+            detection_data = detection.to_dict()
+            detection_data["detector"] = detector_name
+            detections.append(detection_data)
+
+        return {
+            "detections": detections,
+            "working_directory": str(self.working_dir),
+            "total_detections": len(detections)
+        }
+
+    def export_json(self, output_path: Path):
+        """Export detections to JSON using the standard format."""
+        from ..utils.formatters import export_detections_json
+        export_detections_json(self.detections, output_path)
+
+
+class SimpleDetector(AIWorkflow):
+    """Abstract base class for simple detector workflows.
+
+    This class simplifies creating custom detectors by:
+    1. Providing a single abstract method to implement (get_detector_prompt)
+    2. Handling the workflow setup and validation automatically
+    3. Parsing results into standardized AIDetection format
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs, result_class=SimpleDetectorResult)
+
+    @abstractmethod
+    def get_detector_prompt(self) -> str:
+        """Get the detector-specific prompt.
+
+        This should return a prompt that describes:
+        1. What vulnerabilities/issues to look for
+        2. Any specific patterns or code smells
+        3. Context about the protocol/system being analyzed
+
+        The prompt will be wrapped with instructions to output to results.yaml.
+        """
+        pass
+
+    def _setup_steps(self):
+        """Setup the detector workflow with a single analysis step."""
+        # Get the detector-specific prompt
+        detector_prompt = self.get_detector_prompt()
+
+        # Wrap it with instructions for structured output
+        full_prompt = self._build_analysis_prompt(detector_prompt)
+
+        # Add single analysis step
+        # Using None for allowed_tools to inherit the secure defaults from AIWorkflow
+        self.add_step(
+            name="analyze",
+            prompt_template=full_prompt,
+            allowed_tools=None,  # Use parent class defaults which include all necessary tools
+            max_cost=20.0,
+            validator=self._validate_results,
+            max_retries=3,
+            max_retry_cost=10.0
+        )
+
+    def _build_analysis_prompt(self, detector_prompt: str) -> str:
+        """Build the full analysis prompt with output instructions."""
+        return _ANALYSIS_PROMPT_HEAD + detector_prompt + _ANALYSIS_PROMPT_TAIL
+
     def _validate_results(self, response: ClaudeCodeResponse) -> Tuple[bool, List[str]]:
         """Validate that results.yaml was created with proper structure."""
+        import yaml
+
         errors = []
 
         results_file = self.working_dir / "results.yaml"
-        if not results_file.exists():
-            errors.append(f"Results file not created at {results_file}")
-            return (False, errors)
 
         try:
-            with open(results_file, 'r') as f:
-                data = yaml.safe_load(f)
+            data = _load_results_yaml(results_file)
+
+            # Well-formed results pass the compiled schema without walking
+            # every detection in Python
+            schema_validator = _get_results_schema_validator()
+            if schema_validator is not None:
+                import fastjsonschema
+
+                try:
+                    schema_validator(data)
+                    return (True, [])
+                except fastjsonschema.JsonSchemaException:
+                    pass
 
             if not isinstance(data, dict):
                 errors.append("Results file should contain a dictionary")
@@ -318,21 +405,18 @@ detections: []
                     continue
 
                 # Required fields
-                required_fields = ['title', 'severity', 'type', 'description']
-                for field in required_fields:
+                for field in _REQUIRED_FIELDS:
                     if field not in detection:
                         errors.append(f"Detection {i} missing required field '{field}'")
 
                 # Validate severity
                 if 'severity' in detection:
-                    valid_severities = ['critical', 'high', 'medium', 'low', 'info', 'warning']
-                    if detection['severity'].lower() not in valid_severities:
+                    if detection['severity'].lower() not in _VALID_SEVERITIES:
                         errors.append(f"Detection {i} has invalid severity: {detection['severity']}")
 
                 # Validate type
                 if 'type' in detection:
-                    valid_types = ['vulnerability', 'gas-optimization', 'best-practice', 'code-quality']
-                    if detection['type'] not in valid_types:
+                    if not (isinstance(detection['type'], str) and detection['type'] in _VALID_TYPES):
                         errors.append(f"Detection {i} has invalid type: {detection['type']}")
 
                 # Validate location if present
@@ -343,6 +427,8 @@ detections: []
                     elif 'target' not in loc:
                         errors.append(f"Detection {i} location missing 'target' field")
 
+        except FileNotFoundError:
+            errors.append(f"Results file not created at {results_file}")
         except yaml.YAMLError as e:
             errors.append(f"Invalid YAML in results file: {e}")
         except Exception as e:
@@ -1,7 +1,24 @@
 """Common utilities used across Wake AI."""
 
 import enum
+import json
 import sys
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+if HAS_ORJSON:
+    # Leave types the json module cannot encode to the fallback, which raises TypeError
+    _ORJSON_DUMPS_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
 
 
 # Python version compatibility for StrEnum
@@ -12,4 +29,42 @@ if sys.version_info < (3, 11):
 else:
     class StrEnum(enum.StrEnum):
         """String enumeration using native StrEnum for Python >= 3.11."""
-        pass
\ No newline at end of file
+        pass
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to UTF-8 encoded JSON indented by two spaces.
+
+    Uses orjson when it is installed and falls back to the standard
+    library for anything orjson cannot encode. Types orjson would encode
+    natively but the standard library rejects (datetimes, dataclasses,
+    subclasses of str/int/dict/list, non-str keys) are passed through, so
+    both paths accept the same data.
+
+    Non-finite floats are the one difference in output: orjson writes NaN
+    and Infinity as null, while the standard library writes the non-standard
+    NaN/Infinity literals. Avoid storing them in data that is saved to disk.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(data, option=_ORJSON_DUMPS_OPTIONS)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON from bytes.
+
+    Uses orjson when it is installed. Documents orjson rejects but the
+    standard library accepts (the NaN/Infinity literals and numbers that
+    overflow a double) are parsed with the standard library, which also
+    raises the usual errors. orjson returns integers that do not fit in
+    64 bits as floats, so such values lose precision when it is installed.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
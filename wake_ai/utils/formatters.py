@@ -1,28 +1,47 @@
 """Formatting utilities for AI detections."""
 
-import json
+import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, List, Tuple, Union
 
+from rich.console import Group
+from rich.panel import Panel
+from rich.text import Text
+
 from ..detections import Detection, Severity
+from .common import dumps_json
 
 if TYPE_CHECKING:
     from rich.console import Console
     from rich.syntax import SyntaxTheme
 
+# Fenced code blocks with an optional language tag
+_CODE_BLOCK_PATTERN = re.compile(r'```(\w*)\n?(.*?)```', re.DOTALL)
+
+# Title prefix printed for each detection severity
+_SEVERITY_MARKUP = {
+    Severity.INFO: "[[bold blue]INFO[/bold blue]] ",
+    Severity.WARNING: "[[bold yellow]WARNING[/bold yellow]] ",
+    Severity.LOW: "[[bold cyan]LOW[/bold cyan]] ",
+    Severity.MEDIUM: "[[bold magenta]MEDIUM[/bold magenta]] ",
+    Severity.HIGH: "[[bold red]HIGH[/bold red]] ",
+    Severity.CRITICAL: "[[bold red]CRITICAL[/bold red]] ",
+}
+
 
 def _parse_content_with_code_blocks(content: str, theme: Union[str, "SyntaxTheme"] = "monokai") -> List[Any]:
     """Parse content and convert code blocks to Syntax objects."""
+    # Most descriptions have no fenced code at all
+    if "```" not in content:
+        return [Text.from_markup(content.strip() or content)]
+
+    # rich.syntax pulls in Pygments, so it is only imported once something is printed
     from rich.syntax import Syntax
-    from rich.text import Text
-    import re
-    
+
     parts = []
-    # Pattern to match code blocks with optional language
-    code_block_pattern = r'```(\w*)\n?(.*?)```'
-    
+
     last_end = 0
-    for match in re.finditer(code_block_pattern, content, re.DOTALL):
+    for match in _CODE_BLOCK_PATTERN.finditer(content):
         # Add text before code block
         if match.start() > last_end:
             text_before = content[last_end:match.start()].strip()
@@ -58,38 +77,18 @@ def _parse_content_with_code_blocks(content: str, theme: Union[str, "SyntaxTheme
     return parts
 
 
-def print_detection(
+def _build_detection_panel(
     detector_name: str,
     detection: Detection,
-    console: "Console",
-    theme: Union[str, "SyntaxTheme"] = "monokai",
-    *,
-    file_link: bool = True,
-) -> None:
-    """Print a detection to the console."""
-    from rich.console import Group
-    from rich.panel import Panel
+    theme: Union[str, "SyntaxTheme"],
+    file_link: bool,
+) -> Panel:
+    """Build the panel printed for a single detection."""
     from rich.syntax import Syntax
-    from rich.text import Text
 
     # Build title with severity indicators
-    title = ""
-    if detection.severity == Severity.INFO:
-        title += "[[bold blue]INFO[/bold blue]] "
-    elif detection.severity == Severity.WARNING:
-        title += "[[bold yellow]WARNING[/bold yellow]] "
-    elif detection.severity == Severity.LOW:
-        title += "[[bold cyan]LOW[/bold cyan]] "
-    elif detection.severity == Severity.MEDIUM:
-        title += "[[bold magenta]MEDIUM[/bold magenta]] "
-    elif detection.severity == Severity.HIGH:
-        title += "[[bold red]HIGH[/bold red]] "
-    elif detection.severity == Severity.CRITICAL:
-        title += "[[bold red]CRITICAL[/bold red]] "
-
-    title += detection.name
-    if detector_name:
-        title += f" \\[{detector_name}]"
+    detector_suffix = f" \\[{detector_name}]" if detector_name else ""
+    title = f"{_SEVERITY_MARKUP.get(detection.severity, '')}{detection.name}{detector_suffix}"
 
     # Build content
     content_parts = []
@@ -154,7 +153,7 @@ def print_detection(
     # Create panel with all content using Group to combine renderables
     panel_content = Group(*content_parts) if content_parts else Text("No details available")
 
-    panel = Panel.fit(
+    return Panel.fit(
         panel_content,
         title=title,
         title_align="left",
@@ -162,20 +161,61 @@ def print_detection(
         subtitle_align="left",
     )
 
+
+def print_detection(
+    detector_name: str,
+    detection: Detection,
+    console: "Console",
+    theme: Union[str, "SyntaxTheme"] = "monokai",
+    *,
+    file_link: bool = True,
+) -> None:
+    """Print a detection to the console."""
+    panel = _build_detection_panel(detector_name, detection, theme, file_link)
+
     console.print("\n")
     console.print(panel)
 
 
+def print_detections(
+    detections: List[Tuple[str, Detection]],
+    console: "Console",
+    theme: Union[str, "SyntaxTheme"] = "monokai",
+    *,
+    file_link: bool = True,
+) -> None:
+    """Print multiple detections to the console with a single print call.
+
+    The output is the same as calling print_detection for each detection.
+    """
+    renderables = []
+    for detector_name, detection in detections:
+        renderables.append(Text("\n"))
+        renderables.append(_build_detection_panel(detector_name, detection, theme, file_link))
+
+    if renderables:
+        console.print(Group(*renderables))
+
+
 def export_detections_json(
     detections: List[Tuple[str, Detection]],
     output_path: Path,
 ) -> None:
-    """Export detections to JSON format."""
-    data = []
-    for detector_name, detection in detections:
-        detection_data = detection.to_dict()
-        detection_data["detector_name"] = detector_name
-        data.append(detection_data)
+    """Export detections to JSON format.
 
+    Detections are serialized and written one at a time, so the whole
+    document is never held in memory. The output is the same indented
+    JSON array that serializing the full list would produce.
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(data, indent=2))
\ No newline at end of file
+
+    with open(output_path, "wb") as f:
+        separator = b"[\n  "
+        for detector_name, detection in detections:
+            detection_data = detection.to_dict()
+            detection_data["detector_name"] = detector_name
+            # Newlines only occur between tokens, so this nests the object one level
+            f.write(separator)
+            f.write(dumps_json(detection_data).replace(b"\n", b"\n  "))
+            separator = b",\n  "
+        f.write(b"[]" if separator == b"[\n  " else b"\n]")
@@ -2,16 +2,22 @@ import logging
 from typing import Optional
 
 _debug: bool = False
-_created_logger_names: set[str] = set()
+_created_loggers: dict[str, logging.Logger] = {}
 
 
 def get_logger(name: str, override_level: Optional[int] = None) -> logging.Logger:
+    if override_level is None:
+        # set_debug keeps the level of already created loggers up to date
+        logger = _created_loggers.get(name)
+        if logger is not None:
+            return logger
+
     logger = logging.getLogger(name)
 
     if override_level is not None:
         logger.setLevel(override_level)
     else:
-        _created_logger_names.add(name)
+        _created_loggers[name] = logger
         logger.setLevel(logging.DEBUG if _debug else logging.INFO)
     return logger
 
@@ -19,8 +25,9 @@ def get_logger(name: str, override_level: Optional[int] = None) -> logging.Logge
 def set_debug(debug: bool) -> None:
     global _debug
     _debug = debug
-    for name in _created_logger_names:
-        get_logger(name).setLevel(logging.DEBUG if _debug else logging.INFO)
+    level = logging.DEBUG if _debug else logging.INFO
+    for logger in _created_loggers.values():
+        logger.setLevel(level)
 
 
 def get_debug() -> bool:
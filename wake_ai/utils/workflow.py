@@ -1,16 +1,78 @@
 """Workflow-related utility functions."""
 
+import copy
 import json
 from pathlib import Path
-from typing import Dict, Any, Union, List
+from typing import Any, BinaryIO, Callable, Dict, List, Tuple, Union
 
 try:
     import yaml
     HAS_YAML = True
+    # Prefer the libyaml-backed loader when available (same output as safe_load)
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     HAS_YAML = False
 
 from ..core import AIWorkflow
+from .common import dumps_json, loads_json
+
+
+def _parse_json_config(f: BinaryIO) -> Any:
+    return loads_json(f.read())
+
+
+# Workflow definition parsers by file suffix (YAML only when PyYAML is installed)
+_CONFIG_PARSERS: Dict[str, Callable[[BinaryIO], Any]] = {'.json': _parse_json_config}
+if HAS_YAML:
+    def _parse_yaml_config(f: BinaryIO) -> Any:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+    _CONFIG_PARSERS['.yaml'] = _CONFIG_PARSERS['.yml'] = _parse_yaml_config
+
+# Parsed workflow definitions keyed by path, stored with the (mtime_ns, size) they were read at
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _load_workflow_config(path: Path) -> Dict[str, Any]:
+    """Parse a YAML or JSON workflow definition, reusing the result while the file is unchanged.
+
+    Each call returns its own copy, so callers may modify the config freely.
+    """
+    parser = _CONFIG_PARSERS.get(path.suffix)
+    if parser is None:
+        if path.suffix in ['.yaml', '.yml']:
+            raise ImportError(
+                "YAML support requires PyYAML. Install it with: pip install pyyaml"
+            )
+        raise ValueError(f"Unsupported workflow file format: {path.suffix}")
+
+    stat = path.stat()
+    cache_key = str(path.resolve())
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return copy.deepcopy(cached[2])
+
+    with open(path, 'rb') as f:
+        config = parser(f)
+
+    _CONFIG_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, config)
+    return copy.deepcopy(config)
+
+
+class CustomWorkflow(AIWorkflow):
+    """Workflow whose steps come from a parsed workflow definition file."""
+
+    def __init__(self, config: Dict[str, Any], *args, **kwargs):
+        self._config = config
+        super().__init__(*args, **kwargs)
+
+    def _setup_steps(self):
+        for step_config in self._config.get('steps', []):
+            self.add_step(
+                name=step_config['name'],
+                prompt_template=step_config['prompt'],
+                tools=step_config.get('tools')
+            )
 
 
 def load_workflow_from_file(workflow_file: Union[str, Path]) -> AIWorkflow:
@@ -23,32 +85,11 @@ def load_workflow_from_file(workflow_file: Union[str, Path]) -> AIWorkflow:
         Configured AIWorkflow instance
     """
     path = Path(workflow_file)
-
-    if path.suffix in ['.yaml', '.yml']:
-        if not HAS_YAML:
-            raise ImportError(
-                "YAML support requires PyYAML. Install it with: pip install pyyaml"
-            )
-        with open(path) as f:
-            config = yaml.safe_load(f)
-    elif path.suffix == '.json':
-        with open(path) as f:
-            config = json.load(f)
-    else:
-        raise ValueError(f"Unsupported workflow file format: {path.suffix}")
-
-    # Create custom workflow class
-    class CustomWorkflow(AIWorkflow):
-        def _setup_steps(self):
-            for step_config in config.get('steps', []):
-                self.add_step(
-                    name=step_config['name'],
-                    prompt_template=step_config['prompt'],
-                    tools=step_config.get('tools')
-                )
+    config = _load_workflow_config(path)
 
     # Create and return workflow instance
     workflow = CustomWorkflow(
+        config,
         name=config.get('name', 'custom_workflow')
     )
 
@@ -106,7 +147,11 @@ def parse_tool_list(tools_str: str) -> List[str]:
     if not tools_str:
         return []
 
-    return [tool.strip() for tool in tools_str.split(',') if tool.strip()]
+    if ',' not in tools_str:
+        tool = tools_str.strip()
+        return [tool] if tool else []
+
+    return [tool for tool in map(str.strip, tools_str.split(',')) if tool]
 
 
 def format_workflow_results(results: Dict[str, Any], output_format: str = "text") -> str:
@@ -120,42 +165,45 @@ def format_workflow_results(results: Dict[str, Any], output_format: str = "text"
         Formatted results string
     """
     if output_format == "json":
-        return json.dumps(results, indent=2)
+        return dumps_json(results).decode("utf-8")
+
+    workflow_name = results.get('workflow', 'Unknown')
+    completed_steps = results.get('completed_steps', ())
+    errors = results.get('errors', ())
+    duration = results.get('duration', 'N/A')
 
-    elif output_format == "markdown":
+    if output_format == "markdown":
         md_lines = [
-            f"# Workflow: {results.get('workflow', 'Unknown')}",
+            f"# Workflow: {workflow_name}",
             "",
             "## Summary",
-            f"- Completed Steps: {len(results.get('completed_steps', []))}",
-            f"- Errors: {len(results.get('errors', []))}",
-            f"- Duration: {results.get('duration', 'N/A')} seconds",
+            f"- Completed Steps: {len(completed_steps)}",
+            f"- Errors: {len(errors)}",
+            f"- Duration: {duration} seconds",
             f"- Total cost: ${results.get('total_cost', 'N/A')}",
             "",
             "## Completed Steps",
         ]
 
-        for step in results.get('completed_steps', []):
-            md_lines.append(f"- ✓ {step}")
+        md_lines.extend(f"- ✓ {step}" for step in completed_steps)
 
-        if results.get('errors'):
+        if errors:
             md_lines.extend([
                 "",
                 "## Errors",
             ])
-            for error in results['errors']:
-                md_lines.append(f"- **{error['step']}**: {error['error']}")
+            md_lines.extend(f"- **{error['step']}**: {error['error']}" for error in errors)
 
         return "\n".join(md_lines)
 
     else:  # text format
         lines = [
-            f"Workflow: {results.get('workflow', 'Unknown')}",
-            f"Completed: {len(results.get('completed_steps', []))} steps",
-            f"Duration: {results.get('duration', 'N/A')} seconds",
+            f"Workflow: {workflow_name}",
+            f"Completed: {len(completed_steps)} steps",
+            f"Duration: {duration} seconds",
         ]
 
-        if results.get('errors'):
-            lines.append(f"Errors: {len(results['errors'])}")
+        if errors:
+            lines.append(f"Errors: {len(errors)}")
 
-        return "\n".join(lines)
\ No newline at end of file
+        return "\n".join(lines)